@@ -1,3 +1,4 @@
+import os
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -6,6 +7,20 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+# Optional: compile the event- and JSX-rules AST walkers and the string
+# helpers to C extensions with mypyc. Opt in with RTA_MYPYC=1 (the older
+# RTA_EVENT_RULES_JIT=1 is accepted too); the pure-Python modules are used
+# otherwise.
+ext_modules = []
+if "1" in (os.environ.get("RTA_MYPYC"), os.environ.get("RTA_EVENT_RULES_JIT")):
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify([
+        "src/transformer/rules/event_rules.py",
+        "src/transformer/rules/jsx_rules.py",
+        "src/utils/string_utils.py",
+    ])
+
 setup(
     name="react-to-angular-transpiler",
     version="1.0.0",
@@ -27,6 +42,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    ext_modules=ext_modules,
     entry_points={
         "console_scripts": [
             "react-to-angular=src.transpiler:main",
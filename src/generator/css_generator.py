@@ -22,7 +22,7 @@ class CSSGenerator:
         Returns:
             Generated CSS code
         """
-        logger.debug(f"Generating CSS for {component_name}")
+        logger.debug("Generating CSS for %s", component_name)
 
         styles = angular_ast.get("styles", [])
 
@@ -9,12 +9,39 @@ Hardened TypeScript generator that:
 
 import os
 import re
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Pattern
 from ..utils.logger import get_logger
 from ..utils.string_utils import to_pascal_case, to_camel_case
 
 logger = get_logger(__name__)
 
+# Fixed patterns used while normalizing handler bodies, compiled once
+_NGFOR_ARRAY_RE = re.compile(r"of\s+(\w+)")
+_IDENT_RE = re.compile(r"[A-Za-z_]\w*")
+_SIMPLE_LITERAL_RE = re.compile(r'"[^"]*"|\'[^\']*\'|\d+')
+_DOUBLE_THIS_RE = re.compile(r"\bthis\.this\.")
+_STRING_LITERAL_RE = re.compile(r"(\".*?\"|'.*?')")
+
+
+# Patterns that depend on a setter/identifier name, compiled once per name
+@lru_cache(maxsize=512)
+def _spread_setter_re(setter: str, state: str) -> Pattern[str]:
+    return re.compile(
+        rf"{setter}\(\s*\[\s*\.\.\.\s*{state}\s*,\s*([^\]]+?)\s*\]\s*\)",
+        flags=re.S,
+    )
+
+
+@lru_cache(maxsize=512)
+def _setter_call_re(setter: str) -> Pattern[str]:
+    return re.compile(rf"{setter}\(\s*(.+?)\s*\)", flags=re.S)
+
+
+@lru_cache(maxsize=512)
+def _unprefixed_ident_re(ident: str) -> Pattern[str]:
+    return re.compile(rf"(?<!this\.)\b{re.escape(ident)}\b")
+
 
 class TypeScriptGenerator:
     def __init__(self):
@@ -120,7 +147,7 @@ export class {class_name}{implements} {{
                 if isinstance(ngfor, dict):
                     array_name = ngfor.get("array")
                 elif isinstance(ngfor, str):
-                    m = re.search(r"of\s+(\w+)", ngfor)
+                    m = _NGFOR_ARRAY_RE.search(ngfor)
                     if m:
                         array_name = m.group(1)
 
@@ -279,20 +306,20 @@ export class {class_name}{implements} {{
 
         # Convert setX([...state, value]) → this.state.push(value)
         for setter, state in setter_mappings.items():
+            # Both patterns below need a literal "setX(" in the body; skip
+            # compiling/substituting for setters this method never calls
+            if setter + "(" not in normalized:
+                continue
 
             # Match spread array pattern
-            pattern = re.compile(
-                rf"{setter}\(\s*\[\s*\.\.\.\s*{state}\s*,\s*([^\]]+?)\s*\]\s*\)",
-                flags=re.S,
-            )
+            pattern = _spread_setter_re(setter, state)
 
             def repl(m):
                 tail = m.group(1).strip()
                 tail_norm = self._prefix_this_to_identifiers(tail, prop_names)
 
                 # Simple pushable values
-                if re.fullmatch(r"[A-Za-z_]\w*", tail) or \
-                   re.fullmatch(r'"[^"]*"|\'[^\']*\'|\d+', tail):
+                if _IDENT_RE.fullmatch(tail) or _SIMPLE_LITERAL_RE.fullmatch(tail):
                     return f"this.{state}.push({tail_norm})"
 
                 # fallback to spread
@@ -301,10 +328,7 @@ export class {class_name}{implements} {{
             normalized = pattern.sub(repl, normalized)
 
             # Generic setter pattern setX(value) → this.x = value
-            pattern2 = re.compile(
-                rf"{setter}\(\s*(.+?)\s*\)",
-                flags=re.S,
-            )
+            pattern2 = _setter_call_re(setter)
 
             def repl2(m):
                 expr = m.group(1).strip()
@@ -327,7 +351,7 @@ export class {class_name}{implements} {{
         normalized = "\n".join(lines)
 
         # FINAL: clean accidental this.this.
-        normalized = re.sub(r"\bthis\.this\.", "this.", normalized)
+        normalized = _DOUBLE_THIS_RE.sub("this.", normalized)
 
         return normalized
 
@@ -344,12 +368,12 @@ export class {class_name}{implements} {{
             string_placeholders[key] = m.group(0)
             return key
 
-        protected = re.sub(r"(\".*?\"|'.*?')", protect, text)
+        protected = _STRING_LITERAL_RE.sub(protect, text)
 
         # Prefix identifiers
         for ident in sorted(set(identifiers), key=lambda x: -len(x)):
             # DO NOT prefix if already "this.ident"
-            pattern = re.compile(rf"(?<!this\.)\b{re.escape(ident)}\b")
+            pattern = _unprefixed_ident_re(ident)
             protected = pattern.sub(f"this.{ident}", protected)
 
         # Restore string literals
@@ -3,7 +3,7 @@ Clean JSX parser using esprima.
 Removes stringified nodes, removes regex hacks, returns pure JSON-safe AST.
 """
 
-import json
+import sys
 from typing import Any, Dict
 from .parser_interface import ParserInterface
 from ..utils.logger import get_logger
@@ -44,7 +44,7 @@ class JSXParser(ParserInterface):
             return ast_dict
 
         except Exception as e:
-            logger.error(f"JSX parsing failed: {e}")
+            logger.error("JSX parsing failed: %s", e)
             raise
 
     # -------------------------------------------------------------------------
@@ -58,7 +58,10 @@ class JSXParser(ParserInterface):
         if not hasattr(node, '__dict__'):
             return node
 
-        result = {"type": node.type}
+        # Intern node types so the many type comparisons downstream hit
+        # the identity fast path
+        node_type = node.type
+        result = {"type": sys.intern(node_type) if isinstance(node_type, str) else node_type}
 
         for key, value in node.__dict__.items():
 
@@ -10,13 +10,14 @@ Fixes included:
 - EventRules receives the function → correct (click), (change), ngModel detection.
 """
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 from .mappings import ReactAngularMappings
 from .rules.component_rules import ComponentRules
 from .rules.jsx_rules import JSXRules
 from .rules.hooks_rules import HooksRules
 from .rules.event_rules import EventRules
 from ..utils.logger import get_logger
+from ..utils.ast_utils import iter_ast_nodes
 
 logger = get_logger(__name__)
 
@@ -62,10 +63,38 @@ class ASTTransformer:
 
         return None
 
+    def _visit_and_find_component(
+        self, react_ast: Any, on_visit: Callable[[Dict[str, Any], int], None]
+    ):
+        """
+        Walk the whole AST calling on_visit(node, depth) for every node, and
+        return the first FunctionDeclaration on the way.
+        """
+        found = None
+        for node, depth in iter_ast_nodes(react_ast):
+            on_visit(node, depth)
+            if found is None and node["type"] == "FunctionDeclaration":
+                found = node
+        return found
+
     # ---------------------------------------------------------
     # MAIN TRANSFORM
     # ---------------------------------------------------------
-    def transform(self, react_ast: Any) -> Dict[str, Any]:
+    def transform(
+        self,
+        react_ast: Any,
+        on_visit: Optional[Callable[[Dict[str, Any], int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Transform a React AST into an Angular component AST.
+
+        Args:
+            react_ast: Program AST from the parser
+            on_visit: Optional callback, called as on_visit(node, depth) for
+                every node of the React AST (react_ast itself at depth 0)
+                during the component search, which then walks the whole
+                tree instead of stopping early
+        """
         logger.debug("Starting AST transformation")
 
         # The Angular AST structure we will populate
@@ -87,19 +116,22 @@ class ASTTransformer:
         # --------------------------------------------
         # 1️⃣ Extract the actual Function Component
         # --------------------------------------------
-        component_fn = self._find_component_function(react_ast)
+        if on_visit is None:
+            component_fn = self._find_component_function(react_ast)
+        else:
+            component_fn = self._visit_and_find_component(react_ast, on_visit)
 
         if component_fn is None:
             logger.error("No React Function Component found! Cannot transpile.")
             return angular_ast
 
-        logger.debug(f"Component function found: {component_fn.get('id', {}).get('name')}")
+        logger.debug("Component function found: %s", component_fn.get("id", {}).get("name"))
 
         # --------------------------------------------
         # 2️⃣ Hooks (useState, useEffect)
         # --------------------------------------------
         angular_ast = self.hooks_rules.transform(component_fn, angular_ast)
-        print("DEBUG: setterMappings after hooks:", angular_ast.get("setterMappings"))
+        logger.debug("setterMappings after hooks: %s", angular_ast.get("setterMappings"))
 
         # --------------------------------------------
         # 3️⃣ Component metadata (name, methods, props)
@@ -6,13 +6,78 @@ Now includes:
 - Proper assignment extraction
 """
 
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, Callable, ClassVar, Dict, List, Optional
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Shared read-only fallback for `.get(...) or _EMPTY` lookups on AST nodes
+_EMPTY: Any = {}
+
+# Distinguishes "not normalized yet" from a normalized value of None
+_MISSING = object()
+
+# Handler suffix for `setX(e.target.value)` style setters
+_TARGET_VALUE_SUFFIX = " = $event.target.value"
+
+
+def _attr_name(attr: Dict[str, Any]) -> Any:
+    """Name of a JSX attribute, whether stored as a JSXIdentifier node or a plain string."""
+    name_node = attr.get("name")
+    return name_node.get("name") if type(name_node) is dict else name_node
+
+
+# ----------------------------------------------------------------------
+# AST → string handlers, dispatched on node type by EventRules._ast_to_string.
+# Each one either emits tokens to `out` or pushes (is_node, value) entries
+# onto `stack` in reverse order.
+# ----------------------------------------------------------------------
+
+def _emit_identifier(node: Dict[str, Any], out: List[str], stack: List[Any]) -> None:
+    out.append(node.get("name", ""))
+
+
+def _emit_literal(node: Dict[str, Any], out: List[str], stack: List[Any]) -> None:
+    out.append(repr(node.get("value", "")))
+
+
+def _push_member(node: Dict[str, Any], out: List[str], stack: List[Any]) -> None:
+    stack.append((True, node.get("property")))
+    stack.append((False, "."))
+    stack.append((True, node.get("object")))
+
+
+def _push_call(node: Dict[str, Any], out: List[str], stack: List[Any]) -> None:
+    stack.append((False, ")"))
+    args = node.get("arguments", [])
+    for i in range(len(args) - 1, -1, -1):
+        stack.append((True, args[i]))
+        if i:
+            stack.append((False, ", "))
+    stack.append((False, "("))
+    stack.append((True, node.get("callee")))
+
+
+# ⭐ FIXED: count + 1 now works
+def _push_binary(node: Dict[str, Any], out: List[str], stack: List[Any]) -> None:
+    stack.append((True, node.get("right")))
+    stack.append((False, f" {node.get('operator')} "))
+    stack.append((True, node.get("left")))
+
+
+_STRINGIFY_HANDLERS: Dict[str, Callable[[Dict[str, Any], List[str], List[Any]], None]] = {
+    "Identifier": _emit_identifier,
+    "Literal": _emit_literal,
+    "MemberExpression": _push_member,
+    "CallExpression": _push_call,
+    "BinaryExpression": _push_binary,
+}
+
 
 class EventRules:
+    __slots__ = ("_str_cache", "_norm_cache")
+
     EVENT_PREFIX_MAP = {
         "onClick": "click",
         "onChange": "change",
@@ -21,99 +86,122 @@ class EventRules:
         "onBlur": "blur",
     }
 
-    def transform(self, react_ast: Any, angular_ast: Dict[str, Any]) -> Dict[str, Any]:
-        logger.debug("EventRules.transform start")
-
-        setter_mappings = angular_ast.get("setterMappings") or {}
-
-        elements = angular_ast.get("template", {}).get("elements", [])
-        all_elements = self._flatten_elements(elements)
-
-        bindings = angular_ast.setdefault("template", {}).setdefault("bindings", [])
-
-        for el in all_elements:
-            el_id = el.get("id")
-            raw_attrs = el.get("rawJSXAttributes", []) or el.get("attributes", [])
+    # React → Angular event names seen so far, shared across instances.
+    # Capped so unusual input can't grow it without bound.
+    _EVENT_CACHE: ClassVar[Dict[str, str]] = {}
+    _EVENT_CACHE_MAX = 1024
 
-            # Two-way binding check for value + onChange
-            tw = self._detect_two_way_binding(raw_attrs, setter_mappings)
-            if tw:
-                bindings.append({
-                    "type": "twoWay",
-                    "property": tw["property"],
-                    "target": el_id,
-                })
+    def __init__(self) -> None:
+        # id(node) → stringified expression, scoped to a single transform()
+        self._str_cache: Dict[int, str] = {}
+        # id(attr) → normalized attribute value, scoped to a single transform()
+        self._norm_cache: Dict[int, Any] = {}
 
-                el["attributes"] = [
-                    a for a in el.get("attributes", [])
-                    if a.get("name") != "value"
-                ]
-
-                el["twoWayBinding"] = tw["property"]
-                continue
-
-            # Normal event handlers
-            for attr in raw_attrs:
-                name_node = attr.get("name")
-                value_node = attr.get("value")
-
-                attr_name = name_node.get("name") if isinstance(name_node, dict) else name_node
-
-                if not attr_name or not str(attr_name).startswith("on"):
-                    continue
-
-                angular_event = self._transform_event(attr_name)
-                handler_value = self._normalize_attribute_value(value_node)
-                handler = self._transform_handler(handler_value, setter_mappings)
-
-                if not handler:
-                    continue
-
-                # Inline assignment like: count = count + 1
-                if "=" in handler and "(" not in handler:
-                    bindings.append({
-                        "type": "event",
-                        "name": angular_event,
-                        "handler": handler,
-                        "target": el_id,
-                    })
-                    continue
-
-                # Normal handler call
-                bindings.append({
-                    "type": "event",
-                    "name": angular_event,
-                    "handler": handler,
-                    "target": el_id,
-                })
-
-        logger.debug("EventRules.transform end")
+    def transform(self, react_ast: Any, angular_ast: Dict[str, Any]) -> Dict[str, Any]:
+        self._str_cache.clear()
+        self._norm_cache.clear()
+        setter_mappings = angular_ast.get("setterMappings") or {}
+        # element id → raw JSX attributes, recorded by JSXRules
+        raw_attrs_by_id = angular_ast.get("rawJSXAttributes") or {}
+
+        template = angular_ast.setdefault("template", {})
+        bindings = template.setdefault("bindings", [])
+
+        # Single pre-order walk over the element tree: bindings are emitted
+        # as each element is visited, children are pushed in reverse so
+        # elements are processed in source order.
+        stack = list(reversed(template.get("elements", [])))
+        while stack:
+            el = stack.pop()
+            self._process_element(el, raw_attrs_by_id.get(el.get("id")), setter_mappings, bindings)
+
+            children = el.get("children") or ()
+            for i in range(len(children) - 1, -1, -1):
+                child = children[i]
+                if type(child) is dict and child.get("type") in ("Element", "JSXElement"):
+                    stack.append(child)
+
+        # Don't keep AST nodes alive past this call
+        self._str_cache.clear()
+        self._norm_cache.clear()
         return angular_ast
 
     # ----------------------------------------------------------------------
     # Helper functions
     # ----------------------------------------------------------------------
 
-    def _flatten_elements(self, elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        out = []
-        for el in elements:
-            out.append(el)
-            for child in el.get("children", []):
-                if isinstance(child, dict) and child.get("type") in ("Element", "JSXElement"):
-                    out.extend(self._flatten_elements([child]))
-        return out
+    def _process_element(
+        self,
+        el: Dict[str, Any],
+        raw_attrs: Optional[List[Any]],
+        setter_mappings: Dict[str, str],
+        bindings: List[Dict[str, Any]],
+    ) -> None:
+        el_id = el.get("id")
+        if not raw_attrs:
+            raw_attrs = el.get("attributes", [])
+
+        # Two-way binding check for value + onChange
+        tw = self._detect_two_way_binding(raw_attrs, setter_mappings)
+        if tw:
+            bindings.append({
+                "type": "twoWay",
+                "property": tw["property"],
+                "target": el_id,
+            })
+
+            # Only rebuild when a plain `value` attr is actually present
+            attrs = el.get("attributes")
+            if attrs and any(a.get("name") == "value" for a in attrs):
+                el["attributes"] = [a for a in attrs if a.get("name") != "value"]
+
+            el["twoWayBinding"] = tw["property"]
+            return
+
+        # Normal event handlers; only on* attributes can produce a binding
+        event_attrs = [
+            (name, attr) for attr in raw_attrs
+            if (name := _attr_name(attr)) and str(name).startswith("on")
+        ]
+        for attr_name, attr in event_attrs:
+            angular_event = self._transform_event(attr_name)
+            handler_value = self._norm(attr)
+            handler = self._transform_handler(handler_value, setter_mappings)
+
+            if not handler:
+                continue
+
+            # Handler call or inline assignment like: count = count + 1
+            bindings.append({
+                "type": "event",
+                "name": angular_event,
+                "handler": handler,
+                "target": el_id,
+            })
 
     def _normalize_attribute_value(self, raw: Any) -> Any:
-        if isinstance(raw, dict) and raw.get("type") == "JSXExpressionContainer":
+        if type(raw) is dict and raw.get("type") == "JSXExpressionContainer":
             return raw.get("expression")
         return raw
 
+    def _norm(self, attr: Dict[str, Any]) -> Any:
+        """Normalized attribute value, memoized per attribute for the current transform()."""
+        key = id(attr)
+        value = self._norm_cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._norm_cache[key] = self._normalize_attribute_value(attr.get("value"))
+        return value
+
     def _transform_event(self, react_event: str) -> str:
-        if react_event in self.EVENT_PREFIX_MAP:
-            return self.EVENT_PREFIX_MAP[react_event]
-        if react_event.startswith("on"):
-            return react_event[2:].lower()
-        return react_event
+        cached = self._EVENT_CACHE.get(react_event)
+        if cached is None:
+            cached = self.EVENT_PREFIX_MAP.get(react_event)
+            if cached is None:
+                # Intern derived names so repeated events share one string object
+                cached = sys.intern(react_event[2:].lower()) if react_event.startswith("on") else react_event
+            if len(self._EVENT_CACHE) < self._EVENT_CACHE_MAX:
+                self._EVENT_CACHE[react_event] = cached
+        return cached
 
     # ----------------------------------------------------------------------
     # Two-way binding detection
@@ -124,8 +212,7 @@ class EventRules:
         change_attr = None
 
         for attr in attributes:
-            name_node = attr.get("name")
-            attr_name = name_node.get("name") if isinstance(name_node, dict) else name_node
+            attr_name = _attr_name(attr)
 
             if attr_name == "value":
                 value_attr = attr
@@ -135,19 +222,19 @@ class EventRules:
         if not value_attr or not change_attr:
             return None
 
-        val_expr = self._normalize_attribute_value(value_attr.get("value"))
-        change_expr = self._normalize_attribute_value(change_attr.get("value"))
+        val_expr = self._norm(value_attr)
+        change_expr = self._norm(change_attr)
 
-        if isinstance(val_expr, dict) and val_expr.get("type") == "Identifier":
+        if type(val_expr) is dict and val_expr.get("type") == "Identifier":
             state_name = val_expr.get("name")
         else:
             return None
 
         # Detect arrow function: (e) => setX(e.target.value)
-        if isinstance(change_expr, dict) and change_expr.get("type") == "ArrowFunctionExpression":
-            body = change_expr.get("body", {})
+        if type(change_expr) is dict and change_expr.get("type") == "ArrowFunctionExpression":
+            body = change_expr.get("body") or _EMPTY
             if body.get("type") == "CallExpression":
-                setter = body.get("callee", {}).get("name")
+                setter = (body.get("callee") or _EMPTY).get("name")
                 if setter in setter_mappings and setter_mappings[setter] == state_name:
                     return {"property": state_name}
 
@@ -161,7 +248,7 @@ class EventRules:
         if handler_value is None:
             return ""
 
-        if isinstance(handler_value, dict):
+        if type(handler_value) is dict:
             t = handler_value.get("type")
 
             if t == "Identifier":
@@ -183,25 +270,24 @@ class EventRules:
     def _transform_arrow_function(self, arrow_func: Dict[str, Any], setter_mappings: Dict[str, str]):
         params = arrow_func.get("params", [])
         event_var = params[0].get("name", "e") if params else "e"
-        body = arrow_func.get("body")
+        body: Any = arrow_func.get("body")
 
         # (e) => setX(e.target.value)
         if body.get("type") == "CallExpression":
-            setter = body.get("callee", {}).get("name")
+            setter = (body.get("callee") or _EMPTY).get("name")
             state = setter_mappings.get(setter) or self._guess_state(setter)
 
             arg0 = body.get("arguments", [None])[0]
 
             # setter: state = e.target.value
             if arg0 and arg0.get("type") == "MemberExpression":
-                return f"{state} = $event.target.value"
+                return state + _TARGET_VALUE_SUFFIX
 
             # setter: state = expression
             return f"{state} = {self._ast_to_string(arg0)}"
 
         # fallback: replace event param
-        expr = self._ast_to_string(body)
-        return expr.replace(event_var, "$event")
+        return self._ast_to_string_with_subst(body, event_var, "$event")
 
     def _guess_state(self, setter_name: str) -> str:
         if setter_name.startswith("set"):
@@ -214,33 +300,54 @@ class EventRules:
     # ----------------------------------------------------------------------
 
     def _ast_to_string(self, node: Any) -> str:
-        """Convert AST node → readable JS expression."""
-        if not isinstance(node, dict):
-            return str(node)
-
-        t = node.get("type")
-
-        if t == "Identifier":
-            return node.get("name", "")
-
-        if t == "Literal":
-            return repr(node.get("value", ""))
+        """Convert AST node → readable JS expression.
+
+        Results are memoized per node for the duration of the current transform().
+        """
+        key = id(node)
+        cached = self._str_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = self._stringify(node, None, "")
+        if type(node) is dict:
+            self._str_cache[key] = result
+        return result
+
+    def _ast_to_string_with_subst(self, node: Any, from_name: str, to_name: str) -> str:
+        """Like _ast_to_string, but renders Identifier `from_name` as `to_name`.
+
+        Substitution happens during the same walk, so there is no second
+        pass over the output string (and no accidental substring matches).
+        """
+        return self._stringify(node, from_name, to_name)
+
+    def _stringify(self, node: Any, from_name: Optional[str], to_name: str) -> str:
+        """Walk the tree with an explicit stack, collecting tokens into one buffer.
+
+        Stack entries are ``(is_node, value)``: nodes get expanded, plain
+        tokens are emitted as-is, and the buffer is joined once at the end.
+        """
+        out: List[str] = []
+        stack: List[Any] = [(True, node)]
+
+        while stack:
+            is_node, item = stack.pop()
+            if not is_node:
+                out.append(item)
+                continue
 
-        if t == "MemberExpression":
-            obj = self._ast_to_string(node.get("object"))
-            prop = self._ast_to_string(node.get("property"))
-            return f"{obj}.{prop}"
+            if type(item) is not dict:
+                out.append(str(item))
+                continue
 
-        if t == "CallExpression":
-            callee = self._ast_to_string(node.get("callee"))
-            args = ", ".join(self._ast_to_string(a) for a in node.get("arguments", []))
-            return f"{callee}({args})"
+            node_type: Any = item.get("type")
+            if from_name is not None and node_type == "Identifier" and item.get("name") == from_name:
+                out.append(to_name)
+                continue
 
-        # ⭐ FIXED: count + 1 now works
-        if t == "BinaryExpression":
-            left = self._ast_to_string(node.get("left"))
-            right = self._ast_to_string(node.get("right"))
-            op = node.get("operator")
-            return f"{left} {op} {right}"
+            handler = _STRINGIFY_HANDLERS.get(node_type)
+            if handler is not None:
+                handler(item, out, stack)
 
-        return ""
+        return "".join(out)
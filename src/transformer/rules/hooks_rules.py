@@ -2,15 +2,72 @@
 Rules for transforming React useState hooks to Angular class properties.
 """
 
+from functools import lru_cache
 from typing import Any, Dict, List
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _infer_array_type(value: str) -> str:
+    """Infer an array type from the first element of a literal like ['a', 'b']."""
+    if not value.endswith("]"):
+        return "any"
+    first = value[1:-1].lstrip()[:1]
+    if first in ("'", '"'):
+        return "string[]"
+    if first.isdigit():
+        return "number[]"
+    return "any[]"
+
+
+def _infer_string_type(value: str) -> str:
+    return "string"
+
+
+def _infer_boolean_type(value: str) -> str:
+    return "boolean" if value in ("true", "false") else "any"
+
+
+# First character of a stringified initial value → type inference helper
+_TYPE_BY_FIRST_CHAR = {
+    "[": _infer_array_type,
+    '"': _infer_string_type,
+    "'": _infer_string_type,
+    "t": _infer_boolean_type,
+    "f": _infer_boolean_type,
+}
+
+
+@lru_cache(maxsize=1024)
+def _infer_type(initial_value: str) -> str:
+    """Infer TypeScript type from a stringified initial value (memoized)."""
+    if not initial_value:
+        return "any"
+
+    # Dispatch on the first character instead of chained checks
+    infer = _TYPE_BY_FIRST_CHAR.get(initial_value[0])
+    if infer is not None:
+        return infer(initial_value)
+
+    if initial_value.replace(".", "", 1).isdigit():
+        return "number"
+
+    # null, undefined and anything else
+    return "any"
+
+
 class HooksRules:
     """Rules for transforming React useState hooks to Angular class properties."""
 
+    __slots__ = ("_str_cache", "_parse_cache")
+
+    def __init__(self) -> None:
+        # id(node) → stringified node, scoped to a single transform()
+        self._str_cache: Dict[int, str] = {}
+        # id(declaration) → parsed useState hook, scoped to a single transform()
+        self._parse_cache: Dict[int, Dict[str, Any]] = {}
+
     def transform(self, react_ast: Any, angular_ast: Dict[str, Any]) -> Dict[str, Any]:
         """
         Transform React useState hooks to Angular class properties.
@@ -23,6 +80,8 @@ class HooksRules:
             Updated Angular AST
         """
         logger.debug("Applying hooks transformation rules")
+        self._str_cache.clear()
+        self._parse_cache.clear()
 
         # Extract useState hooks from AST
         hooks = self._extract_usestate_hooks(react_ast)
@@ -30,6 +89,9 @@ class HooksRules:
         for hook in hooks:
             self._transform_usestate(hook, angular_ast)
 
+        # Don't keep AST nodes alive past this call
+        self._str_cache.clear()
+        self._parse_cache.clear()
         return angular_ast
 
     def _extract_usestate_hooks(self, react_ast: Any) -> List[Dict[str, Any]]:
@@ -38,75 +100,62 @@ class HooksRules:
         
         Looks for patterns like:
         - const [state, setState] = useState(initialValue)
+
+        Statements are visited with an explicit work list, descending only
+        through `body` (blocks, nested functions); hooks come out in source order.
         """
-        hooks = []
-        
-        # Traverse AST to find useState calls
-        if isinstance(react_ast, dict):
-            # Check for useState patterns in variable declarations
-            if "body" in react_ast:
-                hooks.extend(self._find_hooks_in_body(react_ast["body"]))
-            elif "components" in react_ast:
-                # If AST has component structure, look for hooks in component body
-                hooks.extend(self._find_hooks_in_component(react_ast))
-            elif "statements" in react_ast:
-                hooks.extend(self._find_hooks_in_statements(react_ast["statements"]))
-        
-        return hooks
+        hooks: List[Dict[str, Any]] = []
 
-    def _find_hooks_in_body(self, body: Any) -> List[Dict[str, Any]]:
-        """Find hooks in function/component body."""
-        hooks = []
-        
-        if isinstance(body, list):
-            for item in body:
-                hooks.extend(self._find_hooks_in_statements([item]))
-        elif isinstance(body, dict):
-            hooks.extend(self._find_hooks_in_statements([body]))
-        
-        return hooks
+        if type(react_ast) is not dict:
+            return hooks
 
-    def _find_hooks_in_component(self, react_ast: Any) -> List[Dict[str, Any]]:
-        """Find useState hooks in component structure."""
-        hooks = []
-        
-        # Look for variable declarations with useState
-        if "variables" in react_ast:
-            for var in react_ast["variables"]:
+        if "body" in react_ast:
+            stack = [react_ast["body"]]
+        elif "components" in react_ast:
+            # Component structure lists its variable declarations directly
+            for var in react_ast.get("variables", []):
                 if self._is_usestate_call(var):
                     hooks.append(self._parse_usestate(var))
-        
-        return hooks
+            return hooks
+        elif "statements" in react_ast:
+            stack = [s for s in reversed(react_ast["statements"]) if type(s) is dict]
+        else:
+            return hooks
+
+        while stack:
+            node = stack.pop()
+
+            # A statement list: visit its statements in order
+            if type(node) is list:
+                stack.extend(s for s in reversed(node) if type(s) is dict)
+                continue
+
+            if type(node) is not dict:
+                continue
+
+            # Check for variable declaration with useState
+            if node.get("type") == "VariableDeclaration":
+                for decl in node.get("declarations", []):
+                    if self._is_usestate_call(decl):
+                        hooks.append(self._parse_usestate(decl))
+
+            # Descend into nested structures
+            elif "body" in node:
+                stack.append(node["body"])
 
-    def _find_hooks_in_statements(self, statements: List[Any]) -> List[Dict[str, Any]]:
-        """Find useState hooks in a list of statements."""
-        hooks = []
-        
-        for stmt in statements:
-            if isinstance(stmt, dict):
-                # Check for variable declaration with useState
-                if stmt.get("type") == "VariableDeclaration":
-                    for decl in stmt.get("declarations", []):
-                        if self._is_usestate_call(decl):
-                            hooks.append(self._parse_usestate(decl))
-                
-                # Recursively check nested structures
-                elif "body" in stmt:
-                    hooks.extend(self._find_hooks_in_body(stmt["body"]))
-        
         return hooks
 
     def _is_usestate_call(self, declaration: Any) -> bool:
         """Check if a declaration is a useState call."""
-        if isinstance(declaration, dict):
-            init = declaration.get("init", {})
-            if isinstance(init, dict):
-                callee = init.get("callee", {})
-                if isinstance(callee, dict):
-                    return callee.get("name") == "useState"
-                elif isinstance(callee, str):
-                    return callee == "useState"
-        return False
+        # Happy path is two plain lookups; malformed nodes land in the except
+        try:
+            callee = declaration["init"]["callee"]
+        except (KeyError, TypeError):
+            return False
+
+        if type(callee) is dict:
+            return callee.get("name") == "useState"
+        return isinstance(callee, str) and callee == "useState"
 
     def _parse_usestate(self, declaration: Any) -> Dict[str, Any]:
         """
@@ -121,6 +170,14 @@ class HooksRules:
                 "valueType": inferred_type
             }
         """
+        key = id(declaration)
+        parsed = self._parse_cache.get(key)
+        if parsed is None:
+            parsed = self._parse_cache[key] = self._build_usestate(declaration)
+        return parsed
+
+    def _build_usestate(self, declaration: Any) -> Dict[str, Any]:
+        """Parse a useState declaration; memoized through _parse_usestate."""
         # Extract variable names from destructuring
         id_node = declaration.get("id", {})
         state_name = ""
@@ -148,7 +205,7 @@ class HooksRules:
 
     def _extract_initial_value(self, init_node: Any) -> str:
         """Extract initial value from useState call."""
-        if isinstance(init_node, dict):
+        if type(init_node) is dict:
             arguments = init_node.get("arguments", [])
             if arguments:
                 return self._node_to_string(arguments[0])
@@ -156,52 +213,43 @@ class HooksRules:
 
     def _infer_type(self, initial_value: str) -> str:
         """Infer TypeScript type from initial value."""
-        if not initial_value:
-            return "any"
-        
-        # Simple type inference
-        if initial_value.startswith("[") and initial_value.endswith("]"):
-            # Array - try to infer element type
-            if "string" in initial_value.lower() or initial_value.startswith("['"):
-                return "string[]"
-            elif "number" in initial_value.lower():
-                return "number[]"
-            return "any[]"
-        elif initial_value.startswith('"') or initial_value.startswith("'"):
-            return "string"
-        elif initial_value.replace(".", "").isdigit():
-            return "number"
-        elif initial_value in ["true", "false"]:
-            return "boolean"
-        elif initial_value == "null" or initial_value == "undefined":
-            return "any"
-        
-        return "any"
+        return _infer_type(initial_value)
 
     def _node_to_string(self, node: Any) -> str:
         """Convert AST node to string representation."""
-        if isinstance(node, dict):
-            node_type = node.get("type", "")
-            
-            if node_type == "ArrayExpression":
-                elements = node.get("elements", [])
-                items = [self._node_to_string(elem) for elem in elements]
-                return f"[{', '.join(items)}]"
-            elif node_type == "Literal":
-                return repr(node.get("value", ""))
-            elif node_type == "Identifier":
-                return node.get("name", "")
-            elif node_type == "StringLiteral":
-                return repr(node.get("value", ""))
-            elif node_type == "NumericLiteral":
-                return str(node.get("value", ""))
-            elif node_type == "BooleanLiteral":
-                return str(node.get("value", ""))
-            elif node_type == "CallExpression":
-                callee = self._node_to_string(node.get("callee", {}))
-                args = [self._node_to_string(arg) for arg in node.get("arguments", [])]
-                return f"{callee}({', '.join(args)})"
-        
+        # Empty dicts are throwaway fallbacks whose ids may be reused; skip the memo
+        if type(node) is not dict or not node:
+            return str(node)
+
+        key = id(node)
+        cached = self._str_cache.get(key)
+        if cached is None:
+            cached = self._str_cache[key] = self._build_node_string(node)
+        return cached
+
+    def _build_node_string(self, node: Dict[str, Any]) -> str:
+        """Stringify a single AST node; children go through the memoized path."""
+        node_type = node.get("type", "")
+
+        if node_type == "ArrayExpression":
+            elements = node.get("elements", [])
+            items = [self._node_to_string(elem) for elem in elements]
+            return f"[{', '.join(items)}]"
+        elif node_type == "Literal":
+            return repr(node.get("value", ""))
+        elif node_type == "Identifier":
+            return node.get("name", "")
+        elif node_type == "StringLiteral":
+            return repr(node.get("value", ""))
+        elif node_type == "NumericLiteral":
+            return str(node.get("value", ""))
+        elif node_type == "BooleanLiteral":
+            return str(node.get("value", ""))
+        elif node_type == "CallExpression":
+            callee = self._node_to_string(node.get("callee", {}))
+            args = [self._node_to_string(arg) for arg in node.get("arguments", [])]
+            return f"{callee}({', '.join(args)})"
+
         return str(node)
 
     def _transform_usestate(self, hook: Dict[str, Any], angular_ast: Dict[str, Any]) -> None:
@@ -230,4 +278,4 @@ class HooksRules:
                 angular_ast["setterMappings"] = {}
             angular_ast["setterMappings"][setter_name] = state_name
         
-        logger.debug(f"Transformed useState: {state_name} -> {value_type} = {initial_value}")
+        logger.debug("Transformed useState: %s -> %s = %s", state_name, value_type, initial_value)
@@ -5,17 +5,82 @@ Rules for transforming JSX → Angular template AST.
 - Converts JSX children, text, expressions, and array.map → *ngFor properly.
 """
 
-from typing import Any, Dict, List, Optional
+from itertools import count
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Optional
 from uuid import uuid4
 from ...utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keys through which a ReturnStatement can be reached from a function node:
+# function/block bodies, if/else, declarations (nested helpers), try/switch
+_STATEMENT_KEYS = frozenset({
+    "argument", "body", "consequent", "alternate", "declarations", "declaration",
+    "init", "block", "handler", "finalizer", "cases",
+})
+
+# Node types that never contain a ReturnStatement
+_LEAF_TYPES = frozenset({
+    "Literal", "Identifier", "TemplateElement", "ThisExpression", "Super",
+    "JSXText", "JSXIdentifier", "JSXElement", "JSXFragment",
+})
+
+# JSX attribute name → Angular attribute name
+_ATTR_RENAME = {"className": "class"}
+
+# React-only attributes with no Angular equivalent
+_SKIP_ATTRS = frozenset({"key"})
+
 
 class JSXRules:
     """Rules for JSX → Angular AST transformation."""
 
+    # Node type → handler method name. Resolved to functions per class (see
+    # _bind_dispatch) so each node costs one dict lookup, and subclasses that
+    # override a handler get it picked up in their own table.
+    _CHILD_HANDLERS: ClassVar[Dict[str, str]] = {
+        "JSXText": "_convert_text",
+        "JSXExpressionContainer": "_convert_expression_container",
+        "JSXElement": "_element_shell",
+    }
+    _EXPR_HANDLERS: ClassVar[Dict[str, str]] = {
+        "Identifier": "_identifier_to_string",
+        "Literal": "_literal_to_string",
+        "MemberExpression": "_member_to_string",
+        "CallExpression": "_call_to_string",
+    }
+    _CHILD_DISPATCH: ClassVar[Dict[str, Callable[..., Any]]] = {}
+    _EXPR_DISPATCH: ClassVar[Dict[str, Callable[..., str]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._bind_dispatch()
+
+    @classmethod
+    def _bind_dispatch(cls) -> None:
+        cls._CHILD_DISPATCH = {t: getattr(cls, name) for t, name in cls._CHILD_HANDLERS.items()}
+        cls._EXPR_DISPATCH = {t: getattr(cls, name) for t, name in cls._EXPR_HANDLERS.items()}
+
+    def __init__(self) -> None:
+        self._id_prefix = ""
+        self._id_counter: Iterator[int] = count()
+        # element id → raw JSX attributes, kept off the element dicts
+        self._raw_attrs_by_id: Dict[str, List[Any]] = {}
+        # (element, JSX children) pairs still to convert; see _convert_jsx_to_angular
+        self._pending: List[Any] = []
+        # id(expr) → stringified expression, scoped to a single transform()
+        self._str_cache: Dict[int, str] = {}
+
     def transform(self, react_ast: Any, angular_ast: Dict[str, Any]) -> Dict[str, Any]:
+        # Element IDs are "<prefix>-<n>": one random prefix per transform keeps
+        # them unique across runs, the counter keeps them unique within one.
+        self._id_prefix = uuid4().hex[:8]
+        self._id_counter = count()
+        # Fresh table per transform; it is handed over to EventRules below
+        self._raw_attrs_by_id = {}
+        self._pending = []
+        self._str_cache.clear()
+
         # Find root JSX element inside return statement
         root_jsx = self._find_root_jsx(react_ast)
         if not root_jsx:
@@ -25,28 +90,36 @@ class JSXRules:
         if converted:
             angular_ast["template"]["elements"].append(converted)
 
+        # For EventRules to examine
+        angular_ast["rawJSXAttributes"] = self._raw_attrs_by_id
+
+        # Don't keep AST nodes alive past this call
+        self._str_cache.clear()
         return angular_ast
 
     # ------------------------------------------------------------------
     # Find root JSX element (the element returned by the component)
     # ------------------------------------------------------------------
     def _find_root_jsx(self, node: Any) -> Optional[Dict[str, Any]]:
-        if isinstance(node, dict):
-            if node.get("type") == "ReturnStatement":
-                arg = node.get("argument")
-                if isinstance(arg, dict) and arg.get("type") == "JSXElement":
-                    return arg
-
-            for v in node.values():
-                result = self._find_root_jsx(v)
-                if result:
-                    return result
-
-        elif isinstance(node, list):
-            for item in node:
-                result = self._find_root_jsx(item)
-                if result:
-                    return result
+        # Depth-first, in source order, only following keys that can lead
+        # to a ReturnStatement; children are pushed in reverse.
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if isinstance(n, dict):
+                node_type = n.get("type")
+                if node_type == "ReturnStatement":
+                    arg = n.get("argument")
+                    if isinstance(arg, dict) and arg.get("type") == "JSXElement":
+                        return arg
+                elif node_type in _LEAF_TYPES:
+                    continue
+
+                children = [v for k, v in n.items() if k in _STATEMENT_KEYS]
+                stack.extend(reversed(children))
+
+            elif isinstance(n, list):
+                stack.extend(reversed(n))
 
         return None
 
@@ -57,8 +130,30 @@ class JSXRules:
         if not isinstance(jsx, dict):
             return None
 
+        # Nested elements are not converted recursively: _element_shell
+        # builds each element without its children and queues it here, and
+        # this loop fills the queued children in, so call depth stays flat
+        # however deep the markup is.
+        pending = self._pending
+        try:
+            root = self._element_shell(jsx)
+
+            # _convert_child yields a string, an element dict or None, never a list
+            convert_child = self._convert_child
+            while pending:
+                element, children = pending.pop()
+                element["children"] = [
+                    c for c in map(convert_child, children) if c is not None and c != ""
+                ]
+        finally:
+            # Don't leave elements queued if a conversion raised part-way
+            pending.clear()
+
+        return root
+
+    def _element_shell(self, jsx: Dict[str, Any]) -> Dict[str, Any]:
+        """Angular element for `jsx` with its children queued for conversion."""
         opening = jsx.get("openingElement", {})
-        children = jsx.get("children", [])
 
         # tag
         tag = ""
@@ -71,23 +166,21 @@ class JSXRules:
         attrs = self._convert_attributes(raw_attrs)
 
         # Unique element ID so we can attach event bindings correctly
-        element_id = str(uuid4())
-
-        # Convert children
-        ang_children: List[Any] = []
-        for child in children:
-            converted = self._convert_child(child)
-            if converted not in (None, "", []):
-                ang_children.append(converted)
+        element_id = self._next_id()
+        self._raw_attrs_by_id[element_id] = raw_attrs
 
-        return {
+        element = {
             "id": element_id,
             "type": "Element",
             "tag": tag or "div",
             "attributes": attrs,
-            "rawJSXAttributes": raw_attrs,   # For EventRules to examine
-            "children": ang_children,
+            "children": [],
         }
+        self._pending.append((element, jsx.get("children", [])))
+        return element
+
+    def _next_id(self) -> str:
+        return f"{self._id_prefix}-{next(self._id_counter)}"
 
     # ------------------------------------------------------------------
     # Convert raw JSX attributes → Angular simple attributes
@@ -99,28 +192,20 @@ class JSXRules:
             if not isinstance(attr, dict):
                 continue
 
-            name_node = attr.get("name", {})
-            value_node = attr.get("value", {})
-
-            if not isinstance(name_node, dict):
-                continue
-
-            name = name_node.get("name", "")
-            value = self._extract_attribute_value(value_node)
-
-            # React → Angular rename
-            if name == "className":
-                name = "class"
-
-            # Ignore React "key"
-            if name == "key":
+            # Skips spread attributes and anything without a JSXIdentifier name
+            try:
+                name = attr["name"]["name"]
+            except (KeyError, TypeError):
                 continue
 
-            # Event attributes are handled in EventRules
-            if name.startswith("on"):
+            # Ignore React-only attributes; event attributes are handled in EventRules
+            if name in _SKIP_ATTRS or name[:2] == "on":
                 continue
 
-            out.append({"name": name, "value": value})
+            out.append({
+                "name": _ATTR_RENAME.get(name, name),   # React → Angular rename
+                "value": self._extract_attribute_value(attr.get("value", {})),
+            })
 
         return out
 
@@ -129,10 +214,11 @@ class JSXRules:
     # ------------------------------------------------------------------
     def _extract_attribute_value(self, val: Any) -> str:
         if isinstance(val, dict):
-            if val.get("type") == "Literal":
+            val_type = val.get("type")
+            if val_type == "Literal":
                 return str(val.get("value", ""))
 
-            if val.get("type") == "JSXExpressionContainer":
+            if val_type == "JSXExpressionContainer":
                 expr = val.get("expression", {})
                 return self._expression_to_string(expr)
 
@@ -148,31 +234,26 @@ class JSXRules:
         if not isinstance(child, dict):
             return None
 
-        ctype = child.get("type")
+        child_type: Any = child.get("type")
+        handler = self._CHILD_DISPATCH.get(child_type)
+        return handler(self, child) if handler is not None else None
 
-        # TEXT
-        if ctype == "JSXText":
-            return child.get("value", "").strip()
+    # TEXT
+    def _convert_text(self, child: Dict[str, Any]) -> str:
+        return child.get("value", "").strip()
 
-        # EXPRESSION: Could be {todo}, or {todos.map(...)}
-        if ctype == "JSXExpressionContainer":
-            expr = child.get("expression", {})
-            if not isinstance(expr, dict):
-                return ""
-
-            # array.map() → *ngFor
-            if expr.get("type") == "CallExpression":
-                if self._is_map_expression(expr):
-                    return self._convert_map_expression(expr)
-
-            # fallback → interpolation like {{ todo }}
-            return f"{{{{ {self._expression_to_string(expr)} }}}}"
+    # EXPRESSION: Could be {todo}, or {todos.map(...)}
+    def _convert_expression_container(self, child: Dict[str, Any]) -> Any:
+        expr = child.get("expression", {})
+        if not isinstance(expr, dict):
+            return ""
 
-        # NESTED JSX ELEMENT
-        if ctype == "JSXElement":
-            return self._convert_jsx_to_angular(child)
+        # array.map() → *ngFor
+        if self._is_map_expression(expr):
+            return self._convert_map_expression(expr)
 
-        return None
+        # fallback → interpolation like {{ todo }}
+        return "{{ " + self._expression_to_string(expr) + " }}"
 
     # ------------------------------------------------------------------
     # Detect if expression is array.map(...)
@@ -181,9 +262,10 @@ class JSXRules:
         if expr.get("type") != "CallExpression":
             return False
 
-        callee = expr.get("callee", {})
-        if isinstance(callee, dict) and callee.get("type") == "MemberExpression":
-            prop = callee.get("property", {})
+        callee = expr.get("callee") or {}
+        callee_type = callee.get("type") if isinstance(callee, dict) else None
+        if callee_type == "MemberExpression":
+            prop = callee.get("property") or {}
             return prop.get("name") == "map"
 
         return False
@@ -193,26 +275,31 @@ class JSXRules:
     # → Angular element with *ngFor
     # ------------------------------------------------------------------
     def _convert_map_expression(self, expr: Dict[str, Any]):
-        callee = expr.get("callee", {})
+        callee = expr.get("callee") or {}
         array_name = ""
 
         obj = callee.get("object", {})
         if isinstance(obj, dict):
             array_name = obj.get("name", "")
 
-        fn = expr.get("arguments", [None])[0]
-        params = fn.get("params", []) if isinstance(fn, dict) else []
+        args = expr.get("arguments") or []
+        fn = args[0] if args and isinstance(args[0], dict) else {}
 
-        item = params[0].get("name", "item") if len(params) > 0 else "item"
-        index = params[1].get("name", "index") if len(params) > 1 else "index"
+        params = fn.get("params") or []
+        n_params = len(params)
+        item = params[0].get("name", "item") if n_params else "item"
+        index = params[1].get("name", "index") if n_params > 1 else "index"
+        ng_for = {"array": array_name, "item": item, "index": index}
 
-        # Body may be JSXElement or block with return
-        body = fn.get("body", {})
+        # Body may be JSXElement or block with return; the first is by far
+        # the common shape, so it is checked before any statement scan
+        body = fn.get("body") or {}
+        body_type = body.get("type")
         jsx_body = None
 
-        if body.get("type") == "JSXElement":
+        if body_type == "JSXElement":
             jsx_body = body
-        elif body.get("type") == "BlockStatement":
+        elif body_type == "BlockStatement":
             # find return
             for stmt in body.get("body", []):
                 if stmt.get("type") == "ReturnStatement":
@@ -224,16 +311,16 @@ class JSXRules:
         if not jsx_body:
             # fallback
             return {
-                "id": str(uuid4()),
+                "id": self._next_id(),
                 "type": "Element",
                 "tag": "li",
                 "attributes": [],
-                "ngFor": {"array": array_name, "item": item, "index": index},
-                "children": [f"{{{{ {item} }}}}"],
+                "ngFor": ng_for,
+                "children": ["{{ " + item + " }}"],
             }
 
-        converted = self._convert_jsx_to_angular(jsx_body)
-        converted["ngFor"] = {"array": array_name, "item": item, "index": index}
+        converted = self._element_shell(jsx_body)
+        converted["ngFor"] = ng_for
         return converted
 
     # ------------------------------------------------------------------
@@ -243,22 +330,34 @@ class JSXRules:
         if not isinstance(expr, dict):
             return ""
 
-        etype = expr.get("type")
+        # Memoized per node for the current transform(); subtrees are
+        # revisited from several paths
+        key = id(expr)
+        cached = self._str_cache.get(key)
+        if cached is not None:
+            return cached
 
-        if etype == "Identifier":
-            return expr.get("name", "")
+        expr_type: Any = expr.get("type")
+        handler = self._EXPR_DISPATCH.get(expr_type)
+        result = handler(self, expr) if handler is not None else ""
+        self._str_cache[key] = result
+        return result
 
-        if etype == "Literal":
-            return str(expr.get("value", ""))
+    def _identifier_to_string(self, expr: Dict[str, Any]) -> str:
+        return expr.get("name", "")
 
-        if etype == "MemberExpression":
-            obj = self._expression_to_string(expr.get("object"))
-            prop = self._expression_to_string(expr.get("property"))
-            return f"{obj}.{prop}"
+    def _literal_to_string(self, expr: Dict[str, Any]) -> str:
+        return str(expr.get("value", ""))
 
-        if etype == "CallExpression":
-            callee = self._expression_to_string(expr.get("callee"))
-            args = [self._expression_to_string(a) for a in expr.get("arguments", [])]
-            return f"{callee}({', '.join(args)})"
+    def _member_to_string(self, expr: Dict[str, Any]) -> str:
+        obj = self._expression_to_string(expr.get("object"))
+        prop = self._expression_to_string(expr.get("property"))
+        return obj + "." + prop
 
-        return ""
+    def _call_to_string(self, expr: Dict[str, Any]) -> str:
+        callee = self._expression_to_string(expr.get("callee"))
+        args = [self._expression_to_string(a) for a in expr.get("arguments", [])]
+        return callee + "(" + ", ".join(args) + ")"
+
+
+JSXRules._bind_dispatch()
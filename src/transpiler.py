@@ -3,13 +3,17 @@ Main transpiler class that orchestrates the conversion process.
 """
 
 import os
-import json
-from typing import Optional
+import sys
+import logging
+from typing import Iterable, List, Optional, Tuple
 from .parser import ParserInterface, JSXParser
 from .transformer import ASTTransformer
 from .generator import TypeScriptGenerator, HTMLGenerator, CSSGenerator
-from .utils.logger import get_logger
-from .utils.file_utils import read_file, write_file, ensure_directory
+from .utils.logger import get_logger, configure_logging
+from .utils.file_utils import read_file, write_files, ensure_directory
+from .utils.ast_utils import iter_ast_nodes
+# Re-exported: SKIP_KEYS was defined here before the walker moved to ast_utils
+from .utils.ast_utils import SKIP_KEYS  # noqa: F401
 
 logger = get_logger(__name__)
 
@@ -17,100 +21,91 @@ logger = get_logger(__name__)
 # Clean AST Pretty Printer
 # ---------------------------
 
-SKIP_KEYS = {"loc", "range", "start", "end", "tokens", "comments", "raw"}
 INDENT = "   "
 
+# "<indent>- " line prefixes by depth, built once; deeper nodes build their own
+_PREFIXES = tuple(INDENT * i + "- " for i in range(64))
+
+# labels for better readability, by node type
+_LABEL_FMT = {
+    "Identifier": lambda n: f" ({n.get('name')})",
+    "Literal": lambda n: f" ({n.get('value')})",
+    "JSXIdentifier": lambda n: f" <{n.get('name')}>",
+}
+
 
 def print_angular_ast(angular_ast):
     """Pretty print Angular AST after full transformation."""
-    print("\n================ ANGULAR AST ================\n")
+    # Lines are collected and written in one go rather than print()ed one by one
+    out = ["\n================ ANGULAR AST ================\n"]
 
     cls = angular_ast.get("class", {})
     tmpl = angular_ast.get("template", {})
 
     # Component Name
-    print(f"Component: {cls.get('name')}\n")
+    out.append(f"Component: {cls.get('name')}\n")
 
     # Properties
-    print("PROPERTIES:")
+    out.append("PROPERTIES:")
     if cls.get("properties"):
         for p in cls["properties"]:
             name = p.get("name")
             typ = p.get("type", "")
             init = p.get("initial", "")
-            print(f"  - {name} ({typ}) = {init}")
+            out.append(f"  - {name} ({typ}) = {init}")
     else:
-        print("  (none)")
-    print()
+        out.append("  (none)")
+    out.append("")
 
     # Methods
-    print("METHODS:")
+    out.append("METHODS:")
     if cls.get("methods"):
         for m in cls["methods"]:
-            print(f"  {m['name']}({', '.join(m.get('parameters', []))}):")
-            print(f"    {m['body']}\n")
+            out.append(f"  {m['name']}({', '.join(m.get('parameters', []))}):")
+            out.append(f"    {m['body']}\n")
     else:
-        print("  (none)")
-    print()
+        out.append("  (none)")
+    out.append("")
 
     # Lifecycle Hooks
-    print("LIFECYCLE HOOKS:")
+    out.append("LIFECYCLE HOOKS:")
     if cls.get("lifecycleHooks"):
         for h in cls["lifecycleHooks"]:
-            print(f"  - {h['name']}")
+            out.append(f"  - {h['name']}")
     else:
-        print("  (none)")
-    print()
+        out.append("  (none)")
+    out.append("")
 
     # Template Elements
-    print("TEMPLATE ELEMENTS:")
+    out.append("TEMPLATE ELEMENTS:")
     elements = tmpl.get("elements", [])
     if elements:
         for el in elements:
             tag = el.get("tag", "")
-            print(f"  - <{tag}>")
+            out.append(f"  - <{tag}>")
     else:
-        print("  (none)")
+        out.append("  (none)")
 
-    print("\n============== END ANGULAR AST ==============\n")
+    out.append("\n============== END ANGULAR AST ==============\n")
+    print("\n".join(out))
 
 
 
 def print_ast_tree(node, indent=0):
     """Pretty-print only meaningful AST structure (clean, readable)."""
+    # One write for the whole dump instead of a print() per node
+    out = [_format_ast_node(n, n["type"], depth) for n, depth in iter_ast_nodes(node, indent)]
+    if out:
+        out.append("")
+        sys.stdout.write("\n".join(out))
 
-    # LIST → print each item
-    if isinstance(node, list):
-        for n in node:
-            print_ast_tree(n, indent)
-        return
-
-    # DICT → AST node
-    if isinstance(node, dict):
-
-        node_type = node.get("type")
-        if not node_type:
-            return
-
-        # labels for better readability
-        label = ""
-
-        if node_type == "Identifier":
-            label = f" ({node.get('name')})"
-
-        if node_type == "Literal":
-            label = f" ({node.get('value')})"
-
-        if node_type == "JSXIdentifier":
-            label = f" <{node.get('name')}>"
-
-        print(f"{INDENT * indent}- {node_type}{label}")
 
-        # Recurse into children nodes
-        for key, value in node.items():
-            if key in SKIP_KEYS or key == "type":
-                continue
-            print_ast_tree(value, indent + 1)
+def _format_ast_node(node, node_type, indent):
+    """One line of the AST dump: indented node type plus its label, if any."""
+    fmt = _LABEL_FMT.get(node_type)
+    label = fmt(node) if fmt else ""
+    prefix = _PREFIXES[indent] if indent < len(_PREFIXES) else INDENT * indent + "- "
+    return f"{prefix}{node_type}{label}"
 
 
 # ---------------------------
@@ -120,14 +115,16 @@ def print_ast_tree(node, indent=0):
 class Transpiler:
     """Main transpiler class that converts React components to Angular."""
 
-    def __init__(self, parser: Optional[ParserInterface] = None):
+    def __init__(self, parser: Optional[ParserInterface] = None, debug_ast: bool = False):
         """
         Initialize the transpiler.
 
         Args:
             parser: Parser instance to use. Defaults to JSXParser.
+            debug_ast: Print the React and Angular ASTs while transpiling.
         """
         self.parser = parser or JSXParser()
+        self.debug_ast = debug_ast
         self.transformer = ASTTransformer()
         self.ts_generator = TypeScriptGenerator()
         self.html_generator = HTMLGenerator()
@@ -137,7 +134,7 @@ class Transpiler:
         """
         Transpile a React component to Angular.
         """
-        logger.info(f"Starting transpilation of {input_path}")
+        logger.info("Starting transpilation of %s", input_path)
 
         # Read input file
         source_code = read_file(input_path)
@@ -148,14 +145,29 @@ class Transpiler:
         ast = self.parser.parse(source_code)
         logger.debug("Successfully parsed React code")
 
-        print("\n=== AST STRUCTURE ===")
-        print_ast_tree(ast["body"])   # print only meaningful nodes
-        print("=== END AST STRUCTURE ===\n")
+        # The dumps walk the whole tree, so only build them when asked for.
+        # The AST dump is collected during the transformer's own walk rather
+        # than by a separate print_ast_tree pass.
+        debug_ast = self.debug_ast or logger.isEnabledFor(logging.DEBUG)
+        tree_lines = []
+        on_visit = None
+        if debug_ast:
+            def on_visit(node, depth):
+                # The dump starts at the Program's statements, one level
+                # below the root the transformer walks from
+                if depth:
+                    tree_lines.append(_format_ast_node(node, node["type"], depth - 1))
 
         # Transform AST
-        angular_ast = self.transformer.transform(ast)
+        angular_ast = self.transformer.transform(ast, on_visit=on_visit)
         logger.debug("Successfully transformed AST")
-        print_angular_ast(angular_ast)
+        if debug_ast:
+            print("\n=== AST STRUCTURE ===")
+            if tree_lines:   # print only meaningful nodes
+                tree_lines.append("")
+                sys.stdout.write("\n".join(tree_lines))
+            print("=== END AST STRUCTURE ===\n")
+            print_angular_ast(angular_ast)
 
         # Generate Angular code
         ensure_directory(output_dir)
@@ -166,15 +178,19 @@ class Transpiler:
         css_code = self.css_generator.generate(angular_ast, component_name)
 
         # Write output
-        ts_path = os.path.join(output_dir, f"{component_name}.component.ts")
-        html_path = os.path.join(output_dir, f"{component_name}.component.html")
-        css_path = os.path.join(output_dir, f"{component_name}.component.css")
+        # One join for the shared "<dir>/<Name>.component." prefix
+        prefix = os.path.join(output_dir, component_name + ".component.")
+        ts_path = prefix + "ts"
+        html_path = prefix + "html"
+        css_path = prefix + "css"
 
-        write_file(ts_path, ts_code)
-        write_file(html_path, html_code)
-        write_file(css_path, css_code)
+        write_files([
+            (ts_path, ts_code),
+            (html_path, html_code),
+            (css_path, css_code),
+        ], assume_dir_exists=True)   # output_dir was ensured above
 
-        logger.info(f"Successfully transpiled to {output_dir}")
+        logger.info("Successfully transpiled to %s", output_dir)
 
         return {
             "typescript": ts_path,
@@ -185,27 +201,101 @@ class Transpiler:
     def _extract_component_name(self, file_path: str) -> str:
         """Extract component name from file path."""
         base_name = os.path.basename(file_path)
-        return os.path.splitext(base_name)[0]
+        return base_name.rpartition(".")[0] or base_name
 
 
-def main():
-    """CLI entry point."""
-    import sys
-    import argparse
+# ---------------------------
+# Batch transpilation
+# ---------------------------
+
+# One Transpiler per worker process, built by the pool initializer
+_worker_transpiler: Optional[Transpiler] = None
+
+
+def _init_worker() -> None:
+    global _worker_transpiler
+    _worker_transpiler = Transpiler()
+
 
-    parser = argparse.ArgumentParser(description="Transpile React to Angular")
-    parser.add_argument("input", help="Input React component file")
-    parser.add_argument("output", help="Output directory")
-    args = parser.parse_args()
+def _transpile_in_worker(job: Tuple[str, str]) -> dict:
+    global _worker_transpiler
+    if _worker_transpiler is None:   # pool started without _init_worker
+        _worker_transpiler = Transpiler()
+    input_path, output_dir = job
+    return _worker_transpiler.transpile(input_path, output_dir)
 
-    transpiler = Transpiler()
+
+def transpile_many(
+    input_paths: Iterable[str], output_dir: str, workers: Optional[int] = None
+) -> List[dict]:
+    """
+    Transpile several React components into one output directory.
+
+    Files are independent, so they are spread over a process pool; each
+    worker builds its Transpiler once and reuses it for every file it gets.
+
+    Args:
+        input_paths: Paths to React component files
+        output_dir: Output directory for all generated files
+        workers: Number of worker processes. Defaults to the CPU count.
+
+    Returns:
+        One result dict per input, in input order (see Transpiler.transpile)
+    """
+    jobs = [(path, output_dir) for path in input_paths]
+
+    # Not worth starting a pool for a single file
+    if len(jobs) <= 1 or workers == 1:
+        transpiler = Transpiler()
+        return [transpiler.transpile(path, out) for path, out in jobs]
+
+    # Imported here: concurrent.futures.process pulls in multiprocessing,
+    # which single-file runs never need
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        return list(pool.map(_transpile_in_worker, jobs))
+
+
+_USAGE = """usage: react-to-angular [-h] [--debug-ast] input output
+
+Transpile React to Angular
+
+positional arguments:
+  input        Input React component file
+  output       Output directory
+
+options:
+  -h, --help   show this help message and exit
+  --debug-ast  Print the React and Angular ASTs
+"""
+
+
+def main():
+    """CLI entry point."""
+    # Two positionals and one flag: plain sys.argv handling, no argparse
+    args = sys.argv[1:]
+    if "-h" in args or "--help" in args:
+        sys.stdout.write(_USAGE)
+        sys.exit(0)
+
+    debug_ast = "--debug-ast" in args
+    positional = [a for a in args if a != "--debug-ast"]
+    if len(positional) != 2 or any(a.startswith("-") for a in positional):
+        sys.stderr.write(_USAGE.split("\n", 1)[0] + "\n")
+        sys.stderr.write("react-to-angular: error: expected INPUT and OUTPUT arguments\n")
+        sys.exit(2)
+    input_path, output_dir = positional
+
+    configure_logging()
+    transpiler = Transpiler(debug_ast=debug_ast)
     try:
-        result = transpiler.transpile(args.input, args.output)
+        result = transpiler.transpile(input_path, output_dir)
         print("Successfully transpiled to:")
         for key, path in result.items():
             print(f"  {key}: {path}")
     except Exception as e:
-        logger.error(f"Transpilation failed: {e}")
+        logger.error("Transpilation failed: %s", e)
         sys.exit(1)
 
 
@@ -1,8 +1,9 @@
 """Utility modules for the transpiler."""
 
 from .string_utils import to_pascal_case, to_camel_case, to_kebab_case
-from .file_utils import read_file, write_file, ensure_directory
+from .file_utils import read_file, write_file, write_files, ensure_directory
 from .logger import get_logger
+from .ast_utils import iter_ast_nodes
 
 __all__ = [
     "to_pascal_case",
@@ -10,7 +11,9 @@ __all__ = [
     "to_kebab_case",
     "read_file",
     "write_file",
+    "write_files",
     "ensure_directory",
     "get_logger",
+    "iter_ast_nodes",
 ]
 
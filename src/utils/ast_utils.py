@@ -0,0 +1,50 @@
+"""
+AST traversal helpers shared by the transformer and the debug printers.
+"""
+
+from typing import Any, Dict, Iterator, Tuple
+
+# Keys never descended into: source positions, token streams and raw text,
+# plus "type" itself (it names the node rather than holding children)
+SKIP_KEYS = frozenset({"loc", "range", "start", "end", "tokens", "comments", "raw", "type"})
+
+
+def iter_ast_nodes(root: Any, depth: int = 0) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """
+    Yield (node, depth) for every AST node under `root`, in source order.
+
+    Any dict with a truthy "type" is a node; lists are flattened at the depth
+    of their parent's children. `root` itself is yielded at `depth` when it
+    is a node. Uses an explicit stack, so deep trees don't hit the recursion
+    limit.
+    """
+    stack = [(root, depth)]
+    push = stack.append
+    while stack:
+        node, depth = stack.pop()
+
+        if isinstance(node, list):
+            stack.extend((n, depth) for n in reversed(node))
+            continue
+
+        if not isinstance(node, dict):
+            continue
+
+        node_type = node.get("type")
+        if not node_type:
+            continue
+
+        yield node, depth
+
+        # Children are pushed in reverse so they come off in source order.
+        # Only lists and typed dicts can hold nodes, so scalars are never pushed.
+        child_depth = depth + 1
+        for key, value in reversed(node.items()):
+            if key in SKIP_KEYS:
+                continue
+            value_type = type(value)
+            if value_type is dict:
+                if "type" in value:
+                    push((value, child_depth))
+            elif value_type is list or isinstance(value, (dict, list)):
+                push((value, child_depth))
@@ -3,7 +3,7 @@ File utility functions.
 """
 
 import os
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 from .logger import get_logger
 
 logger = get_logger(__name__)
@@ -20,35 +20,91 @@ def read_file(file_path: str) -> Optional[str]:
         File content as string, or None if error
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
+        # Read raw bytes straight off the fd, sized from fstat, and decode once
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            chunks = []
+            size = os.fstat(fd).st_size
+            chunk = os.read(fd, size or 8192)
+            while chunk:
+                chunks.append(chunk)
+                chunk = os.read(fd, 8192)
+        finally:
+            os.close(fd)
+        text = b"".join(chunks).decode("utf-8")
     except Exception as e:
-        logger.error(f"Failed to read file {file_path}: {e}")
+        logger.error("Failed to read file %s: %s", file_path, e)
         return None
 
+    # Same newline handling as text-mode open()
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
-def write_file(file_path: str, content: str) -> bool:
+
+def write_file(file_path: str, content: str, assume_dir_exists: bool = False) -> bool:
     """
     Write content to a file.
 
     Args:
         file_path: Path to the file
         content: Content to write
+        assume_dir_exists: Skip creating the parent directory
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        ensure_directory(os.path.dirname(file_path))
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
-        logger.debug(f"Successfully wrote file: {file_path}")
+        if not assume_dir_exists:
+            ensure_directory(os.path.dirname(file_path))
+        # Encode once up front; binary mode skips the text-layer encoder
+        with open(file_path, "wb") as f:
+            f.write(content.encode("utf-8"))
+        logger.debug("Successfully wrote file: %s", file_path)
         return True
     except Exception as e:
-        logger.error(f"Failed to write file {file_path}: {e}")
+        logger.error("Failed to write file %s: %s", file_path, e)
         return False
 
 
+def write_files(files: Iterable[Tuple[str, str]], assume_dir_exists: bool = False) -> bool:
+    """
+    Write several files in one pass.
+
+    Parent directories are created once per distinct directory rather than
+    once per file, and each file is written with a single unbuffered write
+    of its UTF-8 encoded content.
+
+    Args:
+        files: (file_path, content) pairs
+        assume_dir_exists: Skip creating the parent directories
+
+    Returns:
+        True if every file was written, False otherwise
+    """
+    files = list(files)
+    if not assume_dir_exists:
+        for directory in {os.path.dirname(path) for path, _ in files}:
+            if not ensure_directory(directory):
+                return False
+
+    ok = True
+    for file_path, content in files:
+        try:
+            data = memoryview(content.encode("utf-8"))
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            logger.debug("Successfully wrote file: %s", file_path)
+        except Exception as e:
+            logger.error("Failed to write file %s: %s", file_path, e)
+            ok = False
+    return ok
+
+
 def ensure_directory(directory: str) -> bool:
     """
     Ensure a directory exists, creating it if necessary.
@@ -62,9 +118,9 @@ def ensure_directory(directory: str) -> bool:
     try:
         if directory and not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
-            logger.debug(f"Created directory: {directory}")
+            logger.debug("Created directory: %s", directory)
         return True
     except Exception as e:
-        logger.error(f"Failed to create directory {directory}: {e}")
+        logger.error("Failed to create directory %s: %s", directory, e)
         return False
 
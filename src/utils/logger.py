@@ -4,16 +4,29 @@ Logging utilities.
 
 import logging
 import sys
-from typing import Optional
+from typing import Dict, Optional
 
-# Configure root logger
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-    ],
-)
+# name → logger, so repeated lookups skip logging's manager lock
+_LOGGERS: Dict[str, logging.Logger] = {}
+
+
+def configure_logging() -> None:
+    """
+    Configure the root logger for command-line use.
+
+    Does nothing if the root logger already has handlers, so an
+    application's own logging setup is left alone.
+    """
+    if logging.getLogger().handlers:
+        return
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+        ],
+    )
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
@@ -26,7 +39,11 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     Returns:
         Logger instance
     """
-    return logging.getLogger(name or __name__)
+    name = name or __name__
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = _LOGGERS[name] = logging.getLogger(name)
+    return logger
 
 
 def set_log_level(level: str) -> None:
@@ -39,4 +56,3 @@ def set_log_level(level: str) -> None:
     numeric_level = getattr(logging, level.upper(), None)
     if isinstance(numeric_level, int):
         logging.root.setLevel(numeric_level)
-
@@ -3,15 +3,26 @@ String utility functions.
 """
 
 import re
+from functools import lru_cache
 
+# Compiled once; these helpers run for every generated identifier
+_WORD_RE = re.compile(r"[a-zA-Z0-9]+")
+_CAMEL_SPLIT_RE = re.compile(r"(?<!^)(?=[A-Z])")
 
+# The same component and prop names come through every generator pass, so the
+# converters are pure functions memoized on their input
+_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
 def to_pascal_case(text: str) -> str:
     """Convert string to PascalCase."""
     # Remove special characters and split
-    words = re.findall(r"[a-zA-Z0-9]+", text)
-    return "".join(word.capitalize() for word in words)
+    cap = str.capitalize
+    return "".join([cap(word) for word in _WORD_RE.findall(text)])
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def to_camel_case(text: str) -> str:
     """Convert string to camelCase."""
     pascal = to_pascal_case(text)
@@ -20,16 +31,24 @@ def to_camel_case(text: str) -> str:
     return pascal[0].lower() + pascal[1:]
 
 
+def _split_camel(text: str, sep: str) -> str:
+    """Lowercase `text`, inserting `sep` before each inner uppercase letter."""
+    # Already lowercase past the first char (e.g. "todo", "todo-list"):
+    # nothing to split
+    if text[1:].islower():
+        return text.lower()
+    return _CAMEL_SPLIT_RE.sub(sep, text).lower()
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
 def to_kebab_case(text: str) -> str:
     """Convert string to kebab-case."""
     # Insert hyphens before uppercase letters
-    text = re.sub(r"(?<!^)(?=[A-Z])", "-", text)
-    return text.lower()
+    return _split_camel(text, "-")
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def to_snake_case(text: str) -> str:
     """Convert string to snake_case."""
     # Insert underscores before uppercase letters
-    text = re.sub(r"(?<!^)(?=[A-Z])", "_", text)
-    return text.lower()
-
+    return _split_camel(text, "_")